@@ -6,7 +6,7 @@ from typing import Dict, List, Optional
 from functools import lru_cache
 from argparse import ArgumentParser
 from translator_testing_model.datamodel.pydanticmodel import TestAsset, ExpectedOutputEnum
-from one_hop_tests.translator.trapi import execute_trapi_lookup, UnitTestReport
+from one_hop_tests.translator.trapi import run_edges, UnitTestReport
 from one_hop_tests.unit_test_templates import (
     by_subject,
     inverse_by_new_subject,
@@ -45,15 +45,6 @@ class OneHopTest:
         self.log_level: Optional[str] = log_level
         self.results: Dict = dict()
 
-    def test_case_wrapper(self, test_asset: TestAsset):
-        async def test_case(test_type) -> UnitTestReport:
-            # TODO: eventually need to process multiple self.endpoints(?)
-            target_url: str = self.endpoints[0]
-            return await execute_trapi_lookup(
-                target_url, test_asset, test_type, self.trapi_version, self.biolink_version
-            )
-        return test_case
-
     async def run(self, test_asset: TestAsset):
         """
         Wrapper to invoke a OneHopTest on a single TestAsset
@@ -62,13 +53,21 @@ class OneHopTest:
         :param test_asset: TestAsset, test to be processed for target TestCases.
         :return: None (use 'get_results()' method below)
         """
-        test_case = self.test_case_wrapper(test_asset=test_asset)
-        self.results["by_subject"] = await test_case(by_subject)
-        self.results["inverse_by_new_subject"] = await test_case(inverse_by_new_subject)
-        self.results["by_object"] = await test_case(by_object)
-        self.results["raise_subject_entity"] = await test_case(raise_subject_entity)
-        self.results["raise_object_by_subject"] = await test_case(raise_object_by_subject)
-        self.results["raise_predicate_by_subject"] = await test_case(raise_predicate_by_subject)
+        # TODO: eventually need to process multiple self.endpoints(?)
+        target_url: str = self.endpoints[0]
+        creators = [
+            by_subject,
+            inverse_by_new_subject,
+            by_object,
+            raise_subject_entity,
+            raise_object_by_subject,
+            raise_predicate_by_subject
+        ]
+        reports: List[UnitTestReport] = await run_edges(
+            target_url, [test_asset], creators, self.trapi_version, self.biolink_version
+        )
+        for creator, report in zip(creators, reports):
+            self.results[creator.__name__] = report
 
     def get_results(self) -> Dict[str, Dict[str, List[str]]]:
         # The ARS_test_Runner with the following command:
@@ -1,19 +1,33 @@
 """
 Code to submit OneHop tests to TRAPI
 """
-from sys import stderr
-from typing import Optional, Dict, Set, List
+from types import MappingProxyType
+from typing import Optional, Dict, Set, List, Tuple, Mapping, AsyncIterator
+from contextlib import asynccontextmanager
+from functools import lru_cache
+import asyncio
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import aiohttp
+
+try:
+    import orjson as _json
+    _HAS_ORJSON = True
+except ImportError:
+    import json as _json
+    _HAS_ORJSON = False
 
 from reasoner_validator.validator import TRAPIResponseValidator
 from reasoner_validator.report import ValidationReporter
-from reasoner_validator.trapi import call_trapi, TRAPISchemaValidator
+from reasoner_validator.trapi import call_trapi, TRAPISchemaValidator, DEFAULT_TRAPI_POST_TIMEOUT
 
 from logging import getLogger
 
 from translator_testing_model.datamodel.pydanticmodel import TestAsset
 
-logger = getLogger()
+logger = getLogger(__name__)
 
 ARS_HOSTS = [
     'ars-prod.transltr.io',
@@ -23,6 +37,77 @@ ARS_HOSTS = [
     'ars.transltr.io'
 ]
 
+# Cap on concurrent TRAPI lookups, to avoid overwhelming the ARS
+DEFAULT_EDGE_CONCURRENCY = 16
+
+# Shared HTTP session, for connection keep-alive and pooling
+# across the (many) synchronous Ontology KP, Node Normalizer and TRAPI calls.
+# Retries of POSTs are safe here since our queries are read-only lookups.
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["GET", "POST"]),
+            raise_on_status=False
+        )
+    )
+)
+
+
+def _loads(response: requests.Response):
+    """
+    Decode the JSON body of an HTTP response, using orjson, when available.
+    :param response: requests.Response, HTTP response with a JSON body
+    :return: decoded JSON content
+    """
+    return _json.loads(response.content)
+
+
+def _json_body(query: Dict) -> Dict:
+    """
+    HTTP client keyword arguments for POSTing a JSON query,
+    serialized directly to bytes by orjson, when available.
+    :param query, JSON query for posting
+    :return: Dict, keyword arguments for requests.post() or aiohttp.ClientSession.post()
+    """
+    if _HAS_ORJSON:
+        return {"data": _json.dumps(query), "headers": {"Content-Type": "application/json"}}
+    else:
+        return {"json": query}
+
+
+def _post(url: str, query: Dict, params=None) -> requests.Response:
+    """
+    HTTP POST a JSON query.
+    :param url, str URL target for HTTP POST
+    :param query, JSON query for posting
+    :param params
+    :return: requests.Response
+    """
+    return _SESSION.post(url, params=params, **_json_body(query))
+
+
+def _log_query_error(server: str, url: str, query: Dict, params, status_code: int):
+    """
+    Report an HTTP error returned for a posted query. The (possibly large) query itself is only logged at DEBUG level.
+    :param server, str human-readable name of server called
+    :param url, str URL target of the HTTP POST
+    :param query, JSON query which was posted
+    :param params
+    :param status_code: int, HTTP error code returned
+    """
+    logger.error(
+        "Server %s at Url: '%s' with parameters '%s' returned HTTP error code: '%s'",
+        server, url, params, status_code
+    )
+    logger.debug("Query posted to server %s: '%s'", server, query)
+
 
 def post_query(url: str, query: Dict, params=None, server: str = ""):
     """
@@ -31,18 +116,75 @@ def post_query(url: str, query: Dict, params=None, server: str = ""):
     :param params
     :param server, str human-readable name of server called (for error message reports)
     """
-    if params is None:
-        response = requests.post(url, json=query)
-    else:
-        response = requests.post(url, json=query, params=params)
+    response = _post(url, query, params=params)
     if not response.status_code == 200:
-        print(
-            f"Server {server} at '\nUrl: '{url}', Query: '{query}' with " +
-            f"parameters '{params}' returned HTTP error code: '{response.status_code}'",
-            file=stderr
-        )
+        _log_query_error(server, url, query, params, response.status_code)
         return {}
-    return response.json()
+    return _loads(response)
+
+
+@asynccontextmanager
+async def trapi_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    Asynchronous context manager for an aiohttp.ClientSession, to be
+    shared (with its connection pool) by a batch of concurrent HTTP calls.
+    """
+    async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=DEFAULT_TRAPI_POST_TIMEOUT)
+    ) as session:
+        yield session
+
+
+async def post_query_async(
+        session: aiohttp.ClientSession,
+        url: str,
+        query: Dict,
+        params=None,
+        server: str = ""
+):
+    """
+    Asynchronous version of post_query(), sharing the given client session.
+    :param session, aiohttp.ClientSession (e.g. from trapi_session()) used for the HTTP POST
+    :param url, str URL target for HTTP POST
+    :param query, JSON query for posting
+    :param params
+    :param server, str human-readable name of server called (for error message reports)
+    """
+    async with session.post(url, params=params, **_json_body(query)) as response:
+        if not response.status == 200:
+            _log_query_error(server, url, query, params, response.status)
+            return {}
+        return _json.loads(await response.read())
+
+
+async def call_trapi_async(session: aiohttp.ClientSession, url: str, trapi_message: Dict) -> Dict:
+    """
+    Asynchronous analogue of the reasoner-validator call_trapi(), posting
+    the TRAPI message to the '/query' endpoint of the url, using the given client session.
+
+    :param session: aiohttp.ClientSession, (e.g. from trapi_session()) used for the HTTP POST
+    :param url: str, target TRAPI url endpoint
+    :param trapi_message: Dict, TRAPI request message
+    :return: Dict, with the 'status_code' and 'response_json' of the TRAPI call
+    """
+    query_url = f'{url}/query'
+    response_json: Optional[Dict] = None
+    try:
+        async with session.post(query_url, **_json_body(trapi_message)) as response:
+            status_code: int = response.status
+            if status_code == 200:
+                try:
+                    response_json = _json.loads(await response.read())
+                except ValueError as exc:
+                    logger.error("call_trapi_async(%s) JSON access error: %s", query_url, exc)
+    except asyncio.TimeoutError:
+        logger.error("call_trapi_async(url: '%s') - Request POST TimeOut?", url)
+        status_code = 408
+    except aiohttp.ClientError as ce:
+        logger.error("call_trapi_async(url: '%s') - Request POST exception: %s", url, ce)
+        status_code = 408
+
+    return {'status_code': status_code, 'response_json': response_json}
 
 
 def generate_test_error_msg_prefix(case: Dict, test_name: str) -> str:
@@ -50,13 +192,15 @@ def generate_test_error_msg_prefix(case: Dict, test_name: str) -> str:
     test_msg_prefix: str = "test_onehops.py::test_trapi_"
     resource_id: str = ""
     component: str = "kp"
-    if 'ara_source' in case and case['ara_source']:
+    ara_source: Optional[str] = case.get('ara_source')
+    kp_source: Optional[str] = case.get('kp_source')
+    if ara_source:
         component = "ara"
-        ara_id = case['ara_source'].replace("infores:", "")
+        ara_id = ara_source.removeprefix("infores:")
         resource_id += ara_id + "|"
     test_msg_prefix += f"{component}s["
-    if 'kp_source' in case and case['kp_source']:
-        kp_id = case['kp_source'].replace("infores:", "")
+    if kp_source:
+        kp_id = kp_source.removeprefix("infores:")
         resource_id += kp_id
     edge_idx = case['idx']
     edge_id = generate_edge_id(resource_id, edge_idx)
@@ -70,6 +214,11 @@ def generate_edge_id(resource_id: str, edge_i: int) -> str:
     return f"{resource_id}#{str(edge_i)}"
 
 
+# UnitTestReport message severities, in reporting order
+UNIT_TEST_SEVERITIES: Tuple[str, ...] = ("skipped", "critical", "failed", "warning", "info")
+SEVERITY: Dict[str, int] = {severity: index for index, severity in enumerate(UNIT_TEST_SEVERITIES)}
+
+
 class UnitTestReport(ValidationReporter):
     """
     UnitTestReport is a wrapper for ValidationReporter used to aggregate SRI Test actionable validation messages.
@@ -82,18 +231,33 @@ class UnitTestReport(ValidationReporter):
             prefix=test_name  # TODO: generate_test_error_msg_prefix(test_case, test_name=test_name)
         )
         self.test_asset = test_asset
-        self.messages: Dict[str, Set[str]] = {
-            "skipped": set(),
-            "critical": set(),
-            "failed": set(),
-            "warning": set(),
-            "info": set()
-        }
+        # (severity, message) records, grouped by severity only when requested
+        self._records: List[Tuple[int, str]] = list()
+        self._messages_json: Optional[bytes] = None
         self.trapi_request: Optional[Dict] = None
         self.trapi_response: Optional[Dict[str, int]] = None
 
     def get_messages(self) -> Dict[str, List[str]]:
-        return {test_name: list(message_set) for test_name, message_set in self.messages.items()}
+        buckets: List[List[str]] = [list() for _ in UNIT_TEST_SEVERITIES]
+        for severity, message in self._records:
+            buckets[severity].append(message)
+        return {
+            severity: list(dict.fromkeys(bucket))
+            for severity, bucket in zip(UNIT_TEST_SEVERITIES, buckets)
+        }
+
+    def to_json_bytes(self) -> bytes:
+        """
+        :return: bytes, JSON serialization of get_messages(), cached until another message is added
+        """
+        if self._messages_json is None:
+            messages_json = _json.dumps(self.get_messages())
+            self._messages_json = messages_json if _HAS_ORJSON else messages_json.encode("utf-8")
+        return self._messages_json
+
+    def _add_message(self, severity: str, message: str):
+        self._records.append((SEVERITY[severity], message))
+        self._messages_json = None
 
     def skip(self, code: str, edge_id: str, messages: Optional[Dict] = None):
         """
@@ -107,7 +271,7 @@ class UnitTestReport(ValidationReporter):
         if messages:
             self.add_messages(messages)
         report_string: str = self.dump_messages(flat=True)
-        self.messages["skipped"].add(report_string)
+        self._add_message("skipped", report_string)
 
     def assert_test_outcome(self):
         """
@@ -116,29 +280,41 @@ class UnitTestReport(ValidationReporter):
         if self.has_critical():
             critical_msg = self.dump_critical(flat=True)
             logger.critical(critical_msg)
-            self.messages["critical"].add(critical_msg)
+            self._add_message("critical", critical_msg)
 
         elif self.has_errors():
             # we now treat 'soft' errors similar to critical errors (above) but
             # the validation messages will be differentiated on the user interface
             err_msg = self.dump_errors(flat=True)
             logger.error(err_msg)
-            self.messages["failed"].add(err_msg)
+            self._add_message("failed", err_msg)
 
         elif self.has_warnings():
             wrn_msg = self.dump_warnings(flat=True)
             logger.warning(wrn_msg)
-            self.messages["warning"].add(wrn_msg)
+            self._add_message("warning", wrn_msg)
 
         elif self.has_information():
             info_msg = self.dump_info(flat=True)
             logger.info(info_msg)
-            self.messages["info"].add(info_msg)
+            self._add_message("info", info_msg)
 
         else:
             pass  # do nothing... just silent pass through...
 
 
+# Read-only template of the KP knowledge source attribute
+# constraint, of which only the 'value' varies per TRAPI request
+_KS_CONSTRAINT_TEMPLATE: Mapping[str, Optional[str]] = MappingProxyType(
+    {
+        "id": "biolink:knowledge_source",
+        "name": "knowledge source",
+        "value": None,
+        "operator": "=="
+    }
+)
+
+
 def constrain_trapi_request_to_kp(trapi_request: Dict, kp_source: str) -> Dict:
     """
     Method to annotate KP constraint on an ARA call
@@ -146,29 +322,83 @@ def constrain_trapi_request_to_kp(trapi_request: Dict, kp_source: str) -> Dict:
     :param trapi_request: Dict, original TRAPI message
     :param kp_source: str, KP InfoRes (from kp_source field of test edge)
     :return: Dict, trapi_request annotated with additional KP 'attribute_constraint'
+    :raises ValueError: if the TRAPI request lacks the query graph 'ab' edge
     """
-    assert "message" in trapi_request
-    message: Dict = trapi_request["message"]
-    assert "query_graph" in message
-    query_graph: Dict = message["query_graph"]
-    assert "edges" in query_graph
-    edges: Dict = query_graph["edges"]
-    assert "ab" in edges
-    edge: Dict = edges["ab"]
+    try:
+        edge: Dict = trapi_request["message"]["query_graph"]["edges"]["ab"]
+    except KeyError as ke:
+        raise ValueError(f"TRAPI request missing required key: {ke}") from ke
 
     # annotate the edge constraint on the (presumed single) edge object
-    edge["attribute_constraints"] = [
-        {
-            "id": "biolink:knowledge_source",
-            "name": "knowledge source",
-            "value": [kp_source],
-            "operator": "=="
-        }
-    ]
+    constraint: Dict = _KS_CONSTRAINT_TEMPLATE.copy()
+    constraint["value"] = [kp_source]
+    edge["attribute_constraints"] = [constraint]
 
     return trapi_request
 
 
+# Patterns of the TRAPI query graph fields filled in from the test asset by the unit test templates
+_QUERY_LEAF_PATTERNS: Dict[str, re.Pattern] = {
+    "ids": re.compile(r"^[^\s:]+:\S+$"),
+    "categories": re.compile(r"^biolink:[A-Z][a-zA-Z]*$"),
+    "predicates": re.compile(r"^biolink:[a-z][a-z_]*$")
+}
+
+# (trapi_version, query shape) of TRAPI requests which already passed schema validation
+_VALID_QUERY_SHAPES: Set[Tuple] = set()
+_MAX_VALID_QUERY_SHAPES: int = 1024
+
+
+def _query_shape(element, field: Optional[str] = None):
+    """
+    Hashable fingerprint of a TRAPI request. The test asset-specific 'ids', 'categories'
+    and 'predicates' lists are reduced to a placeholder when their values are well-formed,
+    such that all requests built by a given unit test template share one fingerprint.
+    All other values (and any malformed test asset values) are kept verbatim.
+    :param element: TRAPI request (or nested component thereof)
+    :param field: Optional[str], key under which the element is found in its parent
+    :return: hashable fingerprint of the element
+    """
+    if isinstance(element, dict):
+        return tuple(sorted((key, _query_shape(value, key)) for key, value in element.items()))
+    elif isinstance(element, list):
+        pattern: Optional[re.Pattern] = _QUERY_LEAF_PATTERNS.get(field)
+        if pattern is not None and element and \
+                all(isinstance(value, str) and pattern.match(value) for value in element):
+            return field, "*"
+        return tuple(_query_shape(value) for value in element)
+    else:
+        return type(element).__name__, element
+
+
+def validate_query(trapi_request: Dict, trapi_version: Optional[str] = None):
+    """
+    Schema validation of a TRAPI request, skipped for requests with the same shape as one
+    which previously passed validation. The unit test templates only vary the test asset
+    node ids, categories and predicates, which are then checked here against their TRAPI patterns.
+    :param trapi_request: Dict, TRAPI request to be validated
+    :param trapi_version: Optional[str], target TRAPI version
+    :raises jsonschema.ValidationError: if the TRAPI request is invalid
+    """
+    try:
+        shape = (trapi_version, _query_shape(trapi_request))
+    except TypeError:
+        # unhashable values? Just validate it
+        shape = None
+
+    if shape is not None and shape in _VALID_QUERY_SHAPES:
+        return
+
+    TRAPISchemaValidator(trapi_version=trapi_version).validate(trapi_request, component="Query")
+
+    # only reached if the request is valid
+    if shape is not None:
+        if len(_VALID_QUERY_SHAPES) >= _MAX_VALID_QUERY_SHAPES:
+            _VALID_QUERY_SHAPES.clear()
+        _VALID_QUERY_SHAPES.add(shape)
+
+
+@lru_cache(maxsize=1024)
 def get_predicate_id(predicate_name: str) -> str:
     """
     SME's (like Jenn) like plain English (possibly capitalized) names
@@ -197,8 +427,8 @@ def translate_test_asset(test_asset: TestAsset, biolink_version: str) -> Dict[st
     test_edge["predicate"] = test_asset.predicate_id \
         if test_asset.predicate_id else get_predicate_id(predicate_name=test_asset.predicate_name)
     test_edge["object_id"] = test_asset.output_id
-    test_edge["subject_category"] = test_asset.output_id
-    test_edge["object_category"] = test_asset.output_id
+    test_edge["subject_category"] = test_asset.input_category
+    test_edge["object_category"] = test_asset.output_category
     test_edge["biolink_version"] = biolink_version
 
     return test_edge
@@ -210,6 +440,7 @@ async def execute_trapi_lookup(
         creator,
         trapi_version: Optional[str] = None,
         biolink_version: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None
 ) -> UnitTestReport:
     """
     Method to execute a TRAPI lookup, using the 'creator' test template.
@@ -219,6 +450,8 @@ async def execute_trapi_lookup(
     :param creator: unit test-specific TRAPI query message creator
     :param trapi_version: Optional[str], target TRAPI version
     :param biolink_version: Optional[str], target Biolink Model version
+    :param session: Optional[aiohttp.ClientSession], shared client session for
+                    (concurrent) TRAPI calls (default: blocking reasoner-validator call_trapi())
     :return: results: Dict of results
     """
     test_report: UnitTestReport = UnitTestReport(test_asset=test_asset, test_name=creator.__name__)
@@ -244,9 +477,7 @@ async def execute_trapi_lookup(
     else:
 
         # sanity check: verify first that the TRAPI request is well-formed by the creator(case)
-        validator: TRAPISchemaValidator = TRAPISchemaValidator(trapi_version=trapi_version)
-        validator.validate(trapi_request, component="Query")
-        test_report.merge(validator)
+        validate_query(trapi_request, trapi_version=trapi_version)
         if not test_report.has_messages():
 
             # if no messages are reported, then continue with the validation
@@ -265,7 +496,10 @@ async def execute_trapi_lookup(
 
             # Make the TRAPI call to the TestCase targeted ARS, KP or
             # ARA resource, using the case-documented input test edge
-            trapi_response = await call_trapi(url, trapi_request)
+            if session is not None:
+                trapi_response = await call_trapi_async(session, url, trapi_request)
+            else:
+                trapi_response = await call_trapi(url, trapi_request)
 
             # Capture the raw TRAPI query input and output
             # for possibly later test harness access
@@ -289,14 +523,14 @@ async def execute_trapi_lookup(
                         test_report.report(code="warning.trapi.response.schema_version.missing")
                     else:
                         trapi_version: str = response['schema_version'] if not trapi_version else trapi_version
-                        print(f"execute_trapi_lookup() using TRAPI version: '{trapi_version}'", file=stderr)
+                        logger.info("execute_trapi_lookup() using TRAPI version: '%s'", trapi_version)
 
                     if 'biolink_version' not in response:
                         test_report.report(code="warning.trapi.response.biolink_version.missing")
                     else:
                         biolink_version = response['biolink_version'] \
                             if not biolink_version else biolink_version
-                        logger.info(f"execute_trapi_lookup() using Biolink Model version: '{biolink_version}'")
+                        logger.info("execute_trapi_lookup() using Biolink Model version: '%s'", biolink_version)
 
                     # If nothing badly wrong with the TRAPI Response to this point, then we also check
                     # whether the test input edge was returned in the Response Message knowledge graph
@@ -332,65 +566,141 @@ async def execute_trapi_lookup(
     return test_report
 
 
-def retrieve_trapi_response(host_url: str, response_id: str):
+async def run_edges(
+        url: str,
+        test_assets: List[TestAsset],
+        creators: List,
+        trapi_version: Optional[str] = None,
+        biolink_version: Optional[str] = None,
+        concurrency: int = DEFAULT_EDGE_CONCURRENCY
+) -> List[UnitTestReport]:
+    """
+    Method to concurrently execute the TRAPI lookups of every
+    test asset against every 'creator' unit test template,
+    sharing a single client session across all the TRAPI calls.
+
+    :param url: str, target TRAPI url endpoint to be tested
+    :param test_assets: List[TestAsset], input data test cases
+    :param creators: List, unit test-specific TRAPI query message creators
+    :param trapi_version: Optional[str], target TRAPI version
+    :param biolink_version: Optional[str], target Biolink Model version
+    :param concurrency: int, maximum number of TRAPI lookups in flight at any one time
+    :return: List[UnitTestReport], in test asset major, creator minor order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with trapi_session() as session:
+
+        async def _lookup(test_asset: TestAsset, creator) -> UnitTestReport:
+            async with semaphore:
+                return await execute_trapi_lookup(
+                    url=url,
+                    test_asset=test_asset,
+                    creator=creator,
+                    trapi_version=trapi_version,
+                    biolink_version=biolink_version,
+                    session=session
+                )
+
+        return list(
+            await asyncio.gather(
+                *[_lookup(test_asset, creator) for test_asset in test_assets for creator in creators]
+            )
+        )
+
+
+async def retrieve_trapi_response(
+        session: aiohttp.ClientSession,
+        host_url: str,
+        response_id: str
+) -> Tuple[int, Optional[bytes]]:
+    response_content: Optional[bytes] = None
     try:
-        response_content = requests.get(
+        async with session.get(
             f"{host_url}{response_id}",
             headers={'accept': 'application/json'}
-        )
-        if response_content:
-            status_code = response_content.status_code
-            if status_code == 200:
-                print(f"...Result returned from '{host_url}'!")
-        else:
-            status_code = 404
+        ) as response:
+            if response.ok:
+                status_code = response.status
+                if status_code == 200:
+                    response_content = await response.read()
+                    logger.debug("...Result returned from '%s'!", host_url)
+            else:
+                status_code = 404
 
     except Exception as e:
-        print(f"Remote host {host_url} unavailable: Connection attempt to {host_url} triggered an exception: {e}")
-        response_content = None
+        logger.debug(
+            "Remote host %s unavailable: Connection attempt to %s triggered an exception: %s", host_url, host_url, e
+        )
         status_code = 404
 
     return status_code, response_content
 
 
-def retrieve_ars_result(response_id: str, verbose: bool):
-    global trapi_response
+def _ars_response_fields(response_content: bytes) -> Optional[Dict]:
+    """
+    Extract the 'fields' of an ARS message response.
+    :param response_content: bytes, raw JSON content of the ARS response
+    :return: Optional[Dict], 'fields' of the ARS response; None if 'fields' is missing
+    """
+    return _json.loads(response_content).get('fields')
 
+
+async def retrieve_ars_result(response_id: str, verbose: bool) -> Optional[Dict]:
+    """
+    Retrieve the TRAPI Response of an ARS message, from whichever ARS host answers first.
+    :param response_id: str, ARS message UUID (primary key) of an individual response
+    :param verbose: bool, report the ARS hosts being tried
+    :return: Optional[Dict], TRAPI Response (i.e. 'fields.data') of the ARS message; None if unavailable
+    """
     if verbose:
-        print(f"Trying to retrieve ARS Response UUID '{response_id}'...")
+        print(f"Trying to retrieve ARS Response UUID '{response_id}' from {', '.join(ARS_HOSTS)}...")
 
-    response_content: Optional = None
+    response_content: Optional[bytes] = None
     status_code: int = 404
 
-    for ars_host in ARS_HOSTS:
-        if verbose:
-            print(f"\n...from {ars_host}", end=None)
-
-        status_code, response_content = retrieve_trapi_response(
-            host_url=f"https://{ars_host}/ars/api/messages/",
-            response_id=response_id
-        )
-        if status_code != 200:
-            continue
+    async with trapi_session() as session:
+        tasks: List[asyncio.Task] = list()
+        for ars_host in ARS_HOSTS:
+            tasks.append(
+                asyncio.create_task(
+                    retrieve_trapi_response(
+                        session=session,
+                        host_url=f"https://{ars_host}/ars/api/messages/",
+                        response_id=response_id
+                    )
+                )
+            )
+        try:
+            # the first ARS host to return the response wins
+            for next_response in asyncio.as_completed(tasks):
+                status_code, response_content = await next_response
+                if status_code == 200:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
 
     if status_code != 200:
         print(f"Unsuccessful HTTP status code '{status_code}' reported for ARS PK '{response_id}'?")
-        return
+        return None
 
-    # Unpack the response content into a dict
+    # Unpack the 'fields' of the response content into a dict
     try:
-        response_dict = response_content.json()
+        fields: Optional[Dict] = _ars_response_fields(response_content)
     except Exception as e:
         print(f"Cannot decode ARS PK '{response_id}' to a Translator Response, exception: {e}")
-        return
+        return None
 
-    if 'fields' in response_dict:
-        if 'actor' in response_dict['fields'] and str(response_dict['fields']['actor']) == '9':
+    if fields is not None:
+        if 'actor' in fields and str(fields['actor']) == '9':
             print("The supplied response id is a collection id. Please supply the UUID for a response")
-        elif 'data' in response_dict['fields']:
+        elif 'data' in fields:
             print(f"Validating ARS PK '{response_id}' TRAPI Response result...")
-            trapi_response = response_dict['fields']['data']
+            return fields['data']
         else:
             print("ARS response dictionary is missing 'fields.data'?")
     else:
         print("ARS response dictionary is missing 'fields'?")
+
+    return None
@@ -1,11 +1,24 @@
 """
 Unit tests of the low level TRAPI (ARS, KP & ARA) calling subsystem.
 """
-from typing import Optional
+from typing import Optional, Dict, List
+import asyncio
 import pytest
+from jsonschema import ValidationError
+from reasoner_validator.trapi import TRAPISchemaValidator
 
 from one_hop_tests import build_test_asset
-from one_hop_tests.translator.trapi import post_query, UnitTestReport, execute_trapi_lookup
+from one_hop_tests.translator import trapi
+from one_hop_tests.translator.trapi import (
+    post_query,
+    post_query_async,
+    trapi_session,
+    _ars_response_fields,
+    _query_shape,
+    validate_query,
+    UnitTestReport,
+    execute_trapi_lookup
+)
 from one_hop_tests.ontology_kp import ONTOLOGY_KP_TRAPI_SERVER, NODE_NORMALIZER_SERVER
 from one_hop_tests.unit_test_templates import by_subject
 
@@ -78,6 +91,26 @@ async def test_post_query_to_node_normalization(curie: str, category: str):
     assert category in result[curie]["type"]
 
 
+@pytest.mark.asyncio
+async def test_post_query_async_batch_to_node_normalization():
+    curies: List[str] = ["HGNC:12791", "MONDO:0011027", "HP:0040068"]
+    async with trapi_session() as session:
+        results = await asyncio.gather(
+            *[
+                post_query_async(
+                    session=session,
+                    url=NODE_NORMALIZER_SERVER,
+                    query={'curies': [curie]},
+                    server="Post Node Normalizer Query"
+                ) for curie in curies
+            ]
+        )
+    for curie, result in zip(curies, results):
+        assert result
+        assert curie in result
+        assert "equivalent_identifiers" in result[curie]
+
+
 @pytest.mark.asyncio
 async def test_execute_trapi_lookup():
     url: str = ""  # where do I send this test TRAPI query? The ARS?
@@ -94,3 +127,102 @@ async def test_execute_trapi_lookup():
         # biolink_version=None
     )
     assert report
+
+
+def _lookup_query(object_id: str, predicate: str) -> Dict:
+    return {
+        "message": {
+            "query_graph": {
+                "nodes": {
+                    "a": {"categories": ["biolink:SmallMolecule"]},
+                    "b": {"ids": [object_id], "categories": ["biolink:Disease"]}
+                },
+                "edges": {
+                    "ab": {"subject": "a", "object": "b", "predicates": [predicate]}
+                }
+            }
+        }
+    }
+
+
+def test_query_shape():
+    shape = _query_shape(_lookup_query("MONDO:0011426", "biolink:treats"))
+    # only the well-formed test asset values differ between these queries
+    assert _query_shape(_lookup_query("MONDO:0005301", "biolink:treats")) == shape
+    assert _query_shape(_lookup_query("MONDO:0005301", "biolink:ameliorates")) == shape
+    # malformed test asset values are kept in the query shape
+    assert _query_shape(_lookup_query("MONDO:0011426", "treats")) != shape
+    assert _query_shape(_lookup_query("", "biolink:treats")) != shape
+
+
+def test_validate_query_skips_known_query_shape(monkeypatch):
+    validated: List[Dict] = list()
+
+    def validate(self, instance, component):
+        validated.append(instance)
+
+    monkeypatch.setattr(trapi, "_VALID_QUERY_SHAPES", set())
+    monkeypatch.setattr(TRAPISchemaValidator, "validate", validate)
+
+    validate_query(_lookup_query("MONDO:0011426", "biolink:treats"), trapi_version="1.4.2")
+    assert len(validated) == 1
+    # same query shape, with different test asset values
+    validate_query(_lookup_query("MONDO:0005301", "biolink:ameliorates"), trapi_version="1.4.2")
+    assert len(validated) == 1
+    # ...but not for another TRAPI version
+    validate_query(_lookup_query("MONDO:0005301", "biolink:ameliorates"), trapi_version="1.3.0")
+    assert len(validated) == 2
+    # malformed test asset values are always validated
+    validate_query(_lookup_query("MONDO:0005301", "treats"), trapi_version="1.4.2")
+    assert len(validated) == 3
+
+
+def test_validate_query_does_not_remember_invalid_query(monkeypatch):
+    validated: List[Dict] = list()
+
+    def validate(self, instance, component):
+        validated.append(instance)
+        raise ValidationError("invalid TRAPI Query")
+
+    monkeypatch.setattr(trapi, "_VALID_QUERY_SHAPES", set())
+    monkeypatch.setattr(TRAPISchemaValidator, "validate", validate)
+
+    for _ in range(2):
+        with pytest.raises(ValidationError):
+            validate_query(_lookup_query("MONDO:0011426", "biolink:treats"), trapi_version="1.4.2")
+    assert len(validated) == 2
+
+
+ARS_RESPONSE = b'''{
+    "model": "tr_ars.message",
+    "pk": "a9b5d9a8-1f5b-4a2e-9a6b-4e8a3a6f7f1c",
+    "fields": {
+        "name": "ara-aragorn",
+        "actor": 3,
+        "status": "Done",
+        "data": {"message": {"query_graph": {"nodes": {}, "edges": {}}, "results": [{"score": 0.5}]}},
+        "url": null
+    }
+}'''
+
+
+def test_ars_response_fields():
+    fields = _ars_response_fields(ARS_RESPONSE)
+    assert fields["actor"] == 3
+    assert fields["data"]["message"]["results"][0]["score"] == 0.5
+
+
+@pytest.mark.parametrize(
+    "content,fields",
+    [
+        (b'{"model": "tr_ars.message"}', None),   # missing 'fields'
+        (b'{"fields": {}}', {})                    # empty 'fields'
+    ]
+)
+def test_ars_response_fields_missing(content: bytes, fields: Optional[Dict]):
+    assert _ars_response_fields(content) == fields
+
+
+def test_ars_response_fields_malformed():
+    with pytest.raises(ValueError):
+        _ars_response_fields(b'{"fields": {"actor": 3, "data": {"message": ')
@@ -1,7 +1,95 @@
 """
 Unit tests to validate UnitTestReport class
 """
+import json as stdlib_json
+
+from one_hop_tests import build_test_asset
+from one_hop_tests.translator import trapi
+from one_hop_tests.translator.trapi import UnitTestReport
+
+
+def _unit_test_report() -> UnitTestReport:
+    test_asset = build_test_asset('MONDO:0005301', 'treats', 'PUBCHEM.COMPOUND:107970', 'Acceptable')
+    return UnitTestReport(test_asset=test_asset, test_name="by_subject")
 
 
 def test_unit_test_report_construction():
-    raise NotImplementedError
+    report: UnitTestReport = _unit_test_report()
+    assert report.test_asset.input_id == 'MONDO:0005301'
+    assert report.prefix == "by_subject"
+    assert not report.has_messages()
+    assert report.get_messages() == {
+        "skipped": [],
+        "critical": [],
+        "failed": [],
+        "warning": [],
+        "info": []
+    }
+
+
+def test_unit_test_report_has_errors():
+    # the UnitTestReport messages must not clobber the ValidationReporter message catalog
+    report: UnitTestReport = _unit_test_report()
+    assert not report.has_errors()
+    report.report(code="error.trapi.response.empty")
+    assert report.has_errors()
+    assert not report.has_critical()
+
+
+def test_unit_test_report_messages_grouped_by_severity():
+    report: UnitTestReport = _unit_test_report()
+    report.report(code="error.trapi.response.empty")
+    report.assert_test_outcome()
+    report.skip(code="warning.trapi.response.schema_version.missing", edge_id="TestAsset:00001")
+    messages = report.get_messages()
+    assert len(messages["failed"]) == 1
+    assert "error.trapi.response.empty" in messages["failed"][0]
+    assert len(messages["skipped"]) == 1
+    assert "warning.trapi.response.schema_version.missing" in messages["skipped"][0]
+    assert not messages["critical"]
+    assert not messages["warning"]
+    assert not messages["info"]
+
+
+def test_unit_test_report_duplicate_messages_collapse_in_order():
+    report: UnitTestReport = _unit_test_report()
+    report.skip(code="warning.trapi.response.schema_version.missing", edge_id="TestAsset:00001")
+    first: str = report.get_messages()["skipped"][0]
+    # same validation messages, thus the same (duplicate) skip message
+    report.skip(code="warning.trapi.response.schema_version.missing", edge_id="TestAsset:00001")
+    report.skip(code="warning.trapi.response.biolink_version.missing", edge_id="TestAsset:00001")
+    report.skip(code="warning.trapi.response.biolink_version.missing", edge_id="TestAsset:00001")
+    skipped = report.get_messages()["skipped"]
+    assert len(skipped) == 2
+    assert skipped[0] == first
+    assert "warning.trapi.response.biolink_version.missing" in skipped[1]
+
+
+def test_unit_test_report_to_json_bytes_is_cached():
+    report: UnitTestReport = _unit_test_report()
+    messages_json: bytes = report.to_json_bytes()
+    assert isinstance(messages_json, bytes)
+    assert stdlib_json.loads(messages_json) == report.get_messages()
+    assert report.to_json_bytes() is messages_json
+
+
+def test_unit_test_report_to_json_bytes_invalidated_by_new_message():
+    report: UnitTestReport = _unit_test_report()
+    empty_json: bytes = report.to_json_bytes()
+    report.skip(code="warning.trapi.response.schema_version.missing", edge_id="TestAsset:00001")
+    skipped_json: bytes = report.to_json_bytes()
+    assert skipped_json != empty_json
+    assert stdlib_json.loads(skipped_json) == report.get_messages()
+    report.report(code="error.trapi.response.empty")
+    report.assert_test_outcome()
+    assert stdlib_json.loads(report.to_json_bytes())["failed"]
+
+
+def test_unit_test_report_to_json_bytes_without_orjson(monkeypatch):
+    monkeypatch.setattr(trapi, "_json", stdlib_json)
+    monkeypatch.setattr(trapi, "_HAS_ORJSON", False)
+    report: UnitTestReport = _unit_test_report()
+    report.skip(code="warning.trapi.response.schema_version.missing", edge_id="TestAsset:00001")
+    messages_json: bytes = report.to_json_bytes()
+    assert isinstance(messages_json, bytes)
+    assert stdlib_json.loads(messages_json) == report.get_messages()